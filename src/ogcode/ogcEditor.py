@@ -8,6 +8,7 @@ This file holds the code for the geometry editor.
 ################################################################################################
 
 import wx
+import math
 
 from .ogcIcons import ogcIcons
 from .ogcEvents import ogcEvents
@@ -16,6 +17,7 @@ from .ogcSettings import ogcSettings
 ################################################################################################
 
 class ogcEditor(wx.Window):
+    RESIZE_DELAY = 100
 
     def __init__(self, parent, gcode):
         style = wx.SIMPLE_BORDER | wx.WANTS_CHARS
@@ -23,11 +25,21 @@ class ogcEditor(wx.Window):
         self.min_size = [640, 480]
         self.SetMinSize(self.min_size)
         self.gcode = gcode
-        self.dc_buffer = wx.Bitmap(*self.Size)
+        self.dc_buffer = None
+        self.dc_mem = None
+        self.AllocBuffer()
         self.color_fg = ogcSettings.Get('editor_fgcolor')
         self.color_bg = ogcSettings.Get('editor_bgcolor')
+        self.pen_fg = wx.Pen(self.color_fg)
+        self.pen_bg = wx.Pen(self.color_bg)
+        self.brush_bg = wx.Brush(self.color_bg)
+        self.pen_point = wx.Pen((255,255,0))
+        self.brush_point = wx.Brush((255,255,0))
         self.Bind(wx.EVT_PAINT, self.OnPaint)
         self.Bind(wx.EVT_SIZE, self.OnSize)
+        self.resize_timer = wx.Timer(self)
+        self.Bind(wx.EVT_TIMER, self.OnResizeTimer, self.resize_timer)
+        self.Bind(wx.EVT_WINDOW_DESTROY, self.OnDestroy)
         self.Show(True)
         self.Compile()
         return
@@ -38,8 +50,11 @@ class ogcEditor(wx.Window):
         self.gcode_h = self.gcode_br[1] - self.gcode_tl[1]
         coord_names = ('X','Y','Z')
         coords = [ (0,0,0) ]
-        self.geom_lines = []
+        # Store cutting moves as polylines: runs of connected points.
+        self.geom_paths = []
         self.geom_points = []
+        self.geom_lods = {}
+        self.dirty = True
         for command in self.gcode.commands:
             if command.code.name == 'G' and command.code.value in [0, 1]:
                 arg_coords = { arg.name:arg.value for arg in command.args if arg.name in coord_names }
@@ -47,49 +62,154 @@ class ogcEditor(wx.Window):
                 y = arg_coords.get('Y', coords[-1][1])
                 z = arg_coords.get('Z', coords[-1][2])
                 if coords[-1][2] < 0:
-                    self.geom_lines.append( (coords[-1][0], coords[-1][1], x, y) )
+                    start = (coords[-1][0], coords[-1][1])
+                    if not self.geom_paths or self.geom_paths[-1][-1] != start:
+                        self.geom_paths.append( [start] )
+                    self.geom_paths[-1].append( (x, y) )
                     self.geom_points.append( (x, y) )
                 coords.append( (x,y,z) )
         return
 
-    def ScalePoint(self, x, y):
-        x = int((x-self.gcode_tl[0]) / self.gcode_w * self.Size[0])
-        y = int((y-self.gcode_tl[1]) / self.gcode_h * self.Size[1])
-        return x, y
+    def ScaleFactors(self):
+        # Fold the fit-to-window transform into one multiply-add per coordinate.
+        sx = self.Size[0] / self.gcode_w if self.gcode_w else 0.0
+        sy = self.Size[1] / self.gcode_h if self.gcode_h else 0.0
+        return sx, -self.gcode_tl[0] * sx, sy, -self.gcode_tl[1] * sy
+
+    def SimplifyPath(self, points, tol):
+        # Ramer-Douglas-Peucker: keep only vertices further than tol from the simplified line.
+        if len(points) < 3:
+            return points
+        keep = [False] * len(points)
+        keep[0] = keep[-1] = True
+        tol2 = tol * tol
+        stack = [ (0, len(points)-1) ]
+        while stack:
+            first, last = stack.pop()
+            x0, y0 = points[first]
+            x1, y1 = points[last]
+            dx, dy = x1 - x0, y1 - y0
+            # Compare squared distances scaled by the squared chord length: no sqrt or divide.
+            seg_len2 = dx*dx + dy*dy
+            dist_max, index = 0.0, first
+            if seg_len2:
+                for i in range(first+1, last):
+                    x, y = points[i]
+                    cross = (x - x0)*dy - (y - y0)*dx
+                    dist = cross * cross
+                    if dist > dist_max:
+                        dist_max, index = dist, i
+                dist_tol = tol2 * seg_len2
+            else:
+                for i in range(first+1, last):
+                    x, y = points[i]
+                    dist = (x - x0)*(x - x0) + (y - y0)*(y - y0)
+                    if dist > dist_max:
+                        dist_max, index = dist, i
+                dist_tol = tol2
+            if dist_max > dist_tol:
+                keep[index] = True
+                stack.append( (first, index) )
+                stack.append( (index, last) )
+        return [ point for point, kept in zip(points, keep) if kept ]
+
+    def SimplifiedPaths(self, sx, sy):
+        # Simplify to within half a pixel; cache per power-of-two tolerance.
+        scale = max(sx, sy)
+        if scale <= 0:
+            return self.geom_paths
+        level = math.floor(math.log2(0.5 / scale))
+        if level not in self.geom_lods:
+            tol = 2.0 ** level
+            self.geom_lods[level] = [ self.SimplifyPath(p, tol) for p in self.geom_paths ]
+        return self.geom_lods[level]
 
     def Draw(self, dc):
+        # Nothing to draw if the G-code has no cutting moves.
+        if not self.geom_points:
+            return
         dc.SetTextForeground(self.color_fg)
-        dc.SetPen(wx.Pen(self.color_fg))
-        dc.SetBrush(wx.Brush(self.color_fg))
-        for line in self.geom_lines:
-            x0, y0 = self.ScalePoint(line[0], line[1])
-            x1, y1 = self.ScalePoint(line[2], line[3])
-            dc.DrawLine(x0, y0, x1, y1)
-        dc.SetPen(wx.Pen((255,255,0)))
-        dc.SetBrush(wx.Brush((255,255,0)))
-        for point in self.geom_points:
-            x0, y0 = self.ScalePoint(*point)
-            dc.DrawCircle(x0, y0, 1)
+        # Scale lines to the window, culling any which collapse to a single pixel,
+        # and batch them into one path so they are stroked with a single call.
+        gc = wx.GraphicsContext.Create(dc)
+        path = gc.CreatePath()
+        sx, ox, sy, oy = self.ScaleFactors()
+        for geom_path in self.SimplifiedPaths(sx, sy):
+            x, y = geom_path[0]
+            last = (int(x*sx + ox), int(y*sy + oy))
+            path.MoveToPoint(*last)
+            for x, y in geom_path[1:]:
+                point = (int(x*sx + ox), int(y*sy + oy))
+                if point != last:
+                    path.AddLineToPoint(*point)
+                    last = point
+        gc.SetPen(self.pen_fg)
+        gc.StrokePath(path)
+        del gc
+        # Draw point markers in one batched call, one marker per distinct pixel.
+        points = { (int(x*sx + ox), int(y*sy + oy)) for x, y in self.geom_points }
+        dc.DrawRectangleList([ (x-1, y-1, 2, 2) for x, y in points ],
+                             pens=self.pen_point, brushes=self.brush_point)
+        return
+
+    def AllocBuffer(self):
+        # Keep one back buffer selected into one memory DC; only replaced on resize.
+        if self.dc_mem is not None:
+            self.dc_mem.SelectObject(wx.NullBitmap)
+        self.dc_buffer = wx.Bitmap(max(1, self.Size[0]), max(1, self.Size[1]))
+        self.dc_mem = wx.MemoryDC(self.dc_buffer)
+        self.dirty = True
         return
 
     def OnPaint(self, event):
-        # Paint with double buffering.
-        dc = wx.MemoryDC()
-        dc.SelectObject(self.dc_buffer)
-        dc.Clear()
-        dc.SetPen(wx.Pen(self.color_bg))
-        dc.SetBrush(wx.Brush(self.color_bg))
-        dc.DrawRectangle(0, 0, self.Size[0], self.Size[1])
-        self.Draw(dc)
-        del dc
-        dc = wx.BufferedPaintDC(self, self.dc_buffer)
+        # Paint with double buffering: only re-render the back buffer when the
+        # geometry or size changed; other paints (expose, focus) just blit it.
+        dc = self.dc_mem
+        if self.dirty:
+            dc.Clear()
+            dc.SetPen(self.pen_bg)
+            dc.SetBrush(self.brush_bg)
+            dc.DrawRectangle(0, 0, self.Size[0], self.Size[1])
+            self.Draw(dc)
+            self.dirty = False
+        # Only blit the damaged part of the window which the buffer covers.
+        paint_dc = wx.PaintDC(self)
+        rect = self.GetUpdateRegion().GetBox()
+        rect.Intersect(wx.Rect(self.dc_buffer.GetSize()))
+        if not rect.IsEmpty():
+            paint_dc.Blit(rect.x, rect.y, rect.width, rect.height, dc, rect.x, rect.y)
         return
 
     def OnSize(self, event):
-        self.dc_buffer = wx.Bitmap(*self.Size)
+        # Ignore size events which do not change the window size.
+        buffer_size = self.dc_buffer.GetSize()
+        if buffer_size == self.Size:
+            return
+        # Grow the buffer at once if it no longer covers the window (first layout,
+        # maximize), so no part of the window is left unpainted.
+        if buffer_size[0] < self.Size[0] or buffer_size[1] < self.Size[1]:
+            self.resize_timer.Stop()
+            self.AllocBuffer()
+            self.Refresh()
+            return
+        # Coalesce resize storms: re-render once the size has settled.
+        self.resize_timer.StartOnce(self.RESIZE_DELAY)
+        return
+
+    def OnResizeTimer(self, event):
+        if self.dc_buffer.GetSize() == self.Size:
+            return
+        self.AllocBuffer()
         self.Refresh()
         return
 
+    def OnDestroy(self, event):
+        # Do not let a pending resize fire on a deleted window.
+        if event.GetEventObject() is self:
+            self.resize_timer.Stop()
+        event.Skip()
+        return
+
 ################################################################################################
 
 class ogcEditorPanel(wx.Window):
@@ -7,24 +7,37 @@ This file holds the code for the info / debug logger.
 '''
 ################################################################################################
 
+import time
 from datetime import datetime
+from collections import deque
 
 ################################################################################################
 class ogcLogManager():
     __log = None
+    __total = 0
+    TIME_FORMAT = "%m/%d/%Y %H:%M:%S"
+    MAX_ENTRIES = 100000
 
     def __init__(self):
         if ogcLogManager.__log is None:
-            now = datetime.now().strftime("%m/%d/%Y %H:%M:%S")
-            ogcLogManager.__log = [ (now, "Begin OG-Code Log") ]
+            # Bounded: the oldest entries are dropped once the log is full.
+            ogcLogManager.__log = deque([ (time.time(), "Begin OG-Code Log") ],
+                                        maxlen=self.MAX_ENTRIES)
+            ogcLogManager.__total = 1
         return
 
     def add(self, text):
-        now = datetime.now().strftime("%m/%d/%Y %H:%M:%S")
+        # Store the raw timestamp; it is only formatted when the entry is read.
+        now = time.time()
         #print(now, text)
         ogcLogManager.__log.append( (now, text) )
+        ogcLogManager.__total += 1
         return
 
+    def format_entry(self, entry):
+        timestamp, text = entry
+        return (datetime.fromtimestamp(timestamp).strftime(self.TIME_FORMAT), text)
+
     def debug(self, text, level):
         if 10 >= level:
             self.add("(debug-#%d) %s"%(level, text))
@@ -32,12 +45,16 @@ class ogcLogManager():
 
     def get(self, index=None):
         if index is not None:
-            return ogcLogManager.__log[index]
-        return ogcLogManager.__log.copy()
+            return self.format_entry(ogcLogManager.__log[index])
+        return [ self.format_entry(entry) for entry in ogcLogManager.__log ]
 
     def count(self):
         return len(ogcLogManager.__log)
 
+    def total(self):
+        # Entries ever added, including those dropped from the front of the log.
+        return ogcLogManager.__total
+
 ################################################################################################
 
 ogcLog = ogcLogManager()
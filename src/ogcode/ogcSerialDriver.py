@@ -7,25 +7,32 @@ This file holds the code for IO with the microcontroller consuming the G-Code da
 '''
 ################################################################################################
 
+import os
+import select
 import serial
 
+from .ogcLog import ogcLog
+
 ################################################################################################
 
 class ogcSerialDriver:
+    WRITE_BLOCK = 4096
+    LINE_MAX    = 256
+    BAUD_RATES  = (250000, 115200, 9600)
 
-    def __init__(self, port_name):
+    def __init__(self, port_name, baudrate=BAUD_RATES[0]):
         # Open and configure the serial port.
         self.serial = serial.Serial()
         self.serial.port = port_name
-        self.confifure()
-        self.serial.open()
+        self.line_buf = bytearray()
+        self.configure()
+        self.baudrate = self.open(baudrate)
         self.serial.flushInput()
         self.serial.flushOutput()
         return
 
     def configure(self):
         self.serial.bytesize = serial.EIGHTBITS
-        self.serial.baudrate = 9600
         self.serial.parity = serial.PARITY_NONE
         self.serial.stopbits = serial.STOPBITS_ONE
         self.serial.timeout = 0     # For non-blocking reading.
@@ -35,11 +42,60 @@ class ogcSerialDriver:
         self.serial.writeTimeout = 0
         return
 
+    def open(self, baudrate):
+        # Try the requested rate first, falling back to slower rates if it is rejected.
+        # Other errors (missing or busy port, no permission) are raised immediately.
+        rates = [baudrate] + [rate for rate in self.BAUD_RATES if rate < baudrate]
+        for rate in rates[:-1]:
+            try:
+                self.serial.baudrate = rate
+                self.serial.open()
+                break
+            except ValueError:
+                ogcLog.add("Serial port %s rejected baud rate %d"%(self.serial.port, rate))
+        else:
+            rate = rates[-1]
+            self.serial.baudrate = rate
+            self.serial.open()
+        ogcLog.add("Opened serial port %s at %d baud"%(self.serial.port, rate))
+        return rate
+
+    def writable(self):
+        # pyserial retries a full output buffer internally, so only write when the OS has room.
+        if os.name != 'posix':
+            return True
+        return bool(select.select([], [self.serial.fileno()], [], 0)[1])
+
     def write(self, data):
-        self.serial.write(data)
+        # Encode text (e.g. a whole G-code script) once, up front.
+        if isinstance(data, str):
+            data = data.encode("utf-8")
+        # Write without blocking: send bounded blocks while the OS accepts them and return
+        # the number of bytes written. The count is of encoded bytes, so a caller which needs
+        # to resume a partial write must pass bytes and continue from data[sent:].
+        sent = 0
+        while sent < len(data) and self.writable():
+            count = self.serial.write(data[sent:sent+self.WRITE_BLOCK])
+            if not count:
+                break
+            sent += count
+        return sent
 
     def read_line(self):
-        return self.serial.readline()
+        # Collect bytes in a reused buffer across calls, as reads are non-blocking.
+        # Return a complete line (or LINE_MAX bytes), else b'' if none is ready yet.
+        end = self.line_buf.find(b'\n')
+        if end < 0:
+            # Pull everything which has arrived in one read, then split lines locally.
+            self.line_buf += self.serial.read(max(1, self.serial.in_waiting))
+            end = self.line_buf.find(b'\n')
+        if end < 0 or end >= self.LINE_MAX:
+            if len(self.line_buf) < self.LINE_MAX:
+                return b''
+            end = self.LINE_MAX - 1
+        line = bytes(self.line_buf[:end+1])
+        del self.line_buf[:end+1]
+        return line
 
     def close(self):
         self.serial.close()
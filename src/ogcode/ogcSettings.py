@@ -72,6 +72,9 @@ class ogcSettingsManager():
                             (str(key), type(value), type(ogcSettingsManager.__settings[key])))
         if type(value) == type([]):
             value = tuple(value)
+        # Don't notify watchers when nothing has changed.
+        if value == ogcSettingsManager.__settings[key]:
+            return value
         ogcSettingsManager.__settings[key] = value
         if callback:
             self.OnChange()
@@ -28,12 +28,32 @@ class ogcLogList(wx.VListBox):
         dc = wx.MemoryDC()
         dc.SetFont(self.font)
         self.SetBackgroundColour((0,0,0))
+        self.brush_bg = wx.Brush((0,0,0))
+        self.brush_selected = wx.Brush((64,0,64))
+        self.pen_border = wx.Pen((0,0,100))
+        self.pen_column = wx.Pen((0,75,150))
+        self.pen_background = wx.Pen((0,0,255))
         self.char_w,self.char_h = dc.GetTextExtent("X")
+        self.log_total = self.log.total()
         self.SetItemCount(self.log.count())
         self.ScrollRows(self.log.count())
         self.Show(True)
         return
 
+    def UpdateItems(self):
+        # Watch the running total rather than the count: once the log is full,
+        # new entries push old ones out and the count stops changing.
+        total = self.log.total()
+        if total == self.log_total:
+            return
+        evicted = total - self.log_total > self.log.count() - self.GetItemCount()
+        self.log_total = total
+        self.SetItemCount(self.log.count())
+        if evicted:
+            # Rows shifted up; redraw them all.
+            self.RefreshAll()
+        return
+
     def LineWrapText(self, initial_text):
         if initial_text is None or len(initial_text) == 0:
             return ("", 0)
@@ -59,18 +79,18 @@ class ogcLogList(wx.VListBox):
 
     def OnDrawItem(self, dc, rect, index):
         timestamp, text = self.log.get(index)
-        text, rows = self.LineWrapText(self.log.get(index)[1])
+        text, rows = self.LineWrapText(text)
         dc.Clear()
         dc.SetFont(self.font)
         # Draw background and borders.
         if self.IsSelected(index):
-            brush = wx.Brush((64,0,64))
+            brush = self.brush_selected
         else:
-            brush = wx.Brush((0,0,0))
+            brush = self.brush_bg
         dc.SetBrush(brush)
-        dc.SetPen(wx.Pen((0,0,100)))
+        dc.SetPen(self.pen_border)
         dc.DrawRectangle(rect[0], rect[1], rect[2], rect[3])
-        dc.SetPen(wx.Pen((0,75,150)))
+        dc.SetPen(self.pen_column)
         offset = self.LINE_NUM_W - 0.5
         dc.DrawLine(rect[0] + int(offset*self.char_w), rect[1],
                     rect[0] + int(offset*self.char_w), rect[1]+rect[3])
@@ -79,7 +99,9 @@ class ogcLogList(wx.VListBox):
                     rect[0] + int(offset*self.char_w), rect[1]+rect[3])
         # Draw log line number and date.
         dc.SetTextForeground((255,255,0))
-        dc.DrawText("%d"%index, rect[0], rect[1])
+        # Number entries from the start of the log, counting any which were dropped.
+        line_num = self.log.total() - self.log.count() + index
+        dc.DrawText("%d"%line_num, rect[0], rect[1])
         dc.SetTextForeground((255,0,255))
         offset = self.LINE_NUM_W
         dc.DrawText(timestamp, rect[0] + offset*self.char_w, rect[1])
@@ -88,18 +110,16 @@ class ogcLogList(wx.VListBox):
         offset = self.LINE_NUM_W + self.DATE_W
         dc.DrawText(text, rect[0] + offset*self.char_w, rect[1])
         # Update to catch new log entries.
-        self.SetItemCount(self.log.count())
+        self.UpdateItems()
         return
 
     def OnDrawBackground(self, dc, rect, index):
         dc.Clear()
-        pen = wx.Pen((0,0,255))
-        dc.SetPen(pen)
-        brush = wx.Brush((0,0,0))
-        dc.SetBrush(brush)
+        dc.SetPen(self.pen_background)
+        dc.SetBrush(self.brush_bg)
         dc.DrawRectangle(rect[0], rect[1], rect[2], rect[3])
         # Update to catch new log entries.
-        self.SetItemCount(self.log.count())
+        self.UpdateItems()
         return
 
     def OnDrawSeparator(self, dc, rect, index):
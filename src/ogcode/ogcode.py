@@ -10,6 +10,7 @@ This file holds the code for the OG-Code application entry point and main window
 import os
 import sys
 import wx
+import threading
 
 from .ogcApp import ogcApp
 from .ogcHelp import ogcAboutFrame, ogcLicenseFrame
@@ -33,6 +34,8 @@ class ogcFrame(wx.Frame):
         wx.Frame.__init__(self, None, wx.ID_ANY, "OC-Code - "+ogcVersion,
                           size = (1366, 768))
         self.Bind(wx.EVT_CLOSE, self.OnClose)
+        # Set in OnClose so late G-code load results are dropped.
+        self.closed = False
         self.icon = wx.Icon()
         self.icon.CopyFromBitmap(ogcIcons.Get('page_edit'))
         self.SetIcon(self.icon)
@@ -105,19 +108,10 @@ class ogcFrame(wx.Frame):
                 # Do nothing if no file selected by user.
                 if file_dialog.ShowModal() != wx.ID_OK:
                     return
-                # Open G-code file and add to new editor tab.
+                # Open G-code file; it is added to a new editor tab once parsed.
                 gcode_path = file_dialog.GetPath()
-                try:
-                    with open(gcode_path, "r") as gfile:
-                        gcode = ogcGCode.gcScript(text=gfile.read())
-                except Exception as excptn:
-                    with wx.MessageDialog(self, "Failed to open G-code file:\n" +
-                                          f"\"{gcode_path}\"\n" +
-                                          f"\nError:\n{excptn}", caption="G-Code Error",
-                                          style=wx.OK|wx.ICON_ERROR) as dlg:
-                        dlg.ShowModal()
-                    return
-                self.editor.NewTab(gcode)
+                threading.Thread(target=self.LoadGCode, args=(gcode_path,),
+                                 daemon=True).start()
             return
         elif menu_id == self.ID_SETTINGS:
             if self.settings_frame is None:
@@ -143,7 +137,36 @@ class ogcFrame(wx.Frame):
             return
         return
 
+    def LoadGCode(self, gcode_path):
+        # Parse G-code files in the background to keep the UI responsive.
+        # Runs on a daemon thread, so an unfinished parse never holds up exit.
+        gcode, error = None, None
+        try:
+            with open(gcode_path, "r") as gfile:
+                gcode = ogcGCode.gcScript(text=gfile.read())
+        except Exception as excptn:
+            error = excptn
+        # Discard the result if the frame has closed while parsing.
+        if not self.closed:
+            wx.CallAfter(self.OnGCodeLoaded, gcode_path, gcode, error)
+        return
+
+    def OnGCodeLoaded(self, gcode_path, gcode, error):
+        # The frame may have been destroyed before this call was delivered.
+        if not self or self.closed:
+            return
+        if error is not None:
+            with wx.MessageDialog(self, "Failed to open G-code file:\n" +
+                                  f"\"{gcode_path}\"\n" +
+                                  f"\nError:\n{error}", caption="G-Code Error",
+                                  style=wx.OK|wx.ICON_ERROR) as dlg:
+                dlg.ShowModal()
+            return
+        self.editor.NewTab(gcode)
+        return
+
     def OnClose(self, event=None):
+        self.closed = True
         if self.settings_frame is not None:
             self.settings_frame.OnClose()
         if self.about_frame is not None: